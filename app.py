@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
+import time
+from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
 import streamlit as st
@@ -10,14 +14,22 @@ import streamlit as st
 from main import (
     RSS_SOURCES,
     YAHOO_SYMBOL,
+    FuturesSnapshot,
     combine_signal,
+    create_session,
     expected_move_pct,
     fetch_news,
     fetch_price_snapshot,
     filter_recent,
 )
 
+if TYPE_CHECKING:
+    import requests
 
+PRICE_CACHE_SECONDS = 900
+
+
+@lru_cache(maxsize=256)
 def classify_signal(score: float) -> tuple[str, str]:
     if score >= 0.15:
         return "Bullish", "increase"
@@ -26,11 +38,44 @@ def classify_signal(score: float) -> tuple[str, str]:
     return "Neutral", "move sideways"
 
 
+@st.cache_resource
+def get_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=8)
+
+
+@st.cache_resource
+def get_session() -> requests.Session:
+    return create_session(retries=3, pool_size=8)
+
+
+# Streamlit ignores ttl for disk-persisted caches, so the fetch time is stored
+# with the snapshot and staleness is checked in _load_snapshot.
+@st.cache_data(persist="disk", show_spinner=False)
+def _cached_snapshot(
+    symbol: str, _session: requests.Session
+) -> tuple[float, FuturesSnapshot]:
+    snapshot = fetch_price_snapshot(symbol, timeout=25, retries=3, session=_session)
+    return time.time(), snapshot
+
+
+def _load_snapshot(symbol: str, session: requests.Session) -> FuturesSnapshot:
+    fetched_at, snapshot = _cached_snapshot(symbol, session)
+    if time.time() - fetched_at > PRICE_CACHE_SECONDS:
+        _cached_snapshot.clear(symbol, session)
+        fetched_at, snapshot = _cached_snapshot(symbol, session)
+    return snapshot
+
+
+@st.cache_data(ttl=300, show_spinner=False)
 def load_data() -> tuple:
     now = datetime.now(timezone.utc)
-    news = fetch_news(RSS_SOURCES)
+    # The shared pool only runs leaf feed downloads; fetch_news itself waits
+    # on them from its own thread.
+    with ThreadPoolExecutor(max_workers=1) as loader:
+        news_job = loader.submit(fetch_news, RSS_SOURCES, get_executor())
+        futures = _load_snapshot(YAHOO_SYMBOL, get_session())
+        news = news_job.result()
     filtered, window_label = filter_recent(news, now, today_only=True)
-    futures = fetch_price_snapshot(YAHOO_SYMBOL, timeout=25, retries=3)
     combined_score = combine_signal(filtered, futures)
     move_pct = expected_move_pct(combined_score, futures)
     expected_price = futures.yesterday_close * (1 + move_pct / 100.0)
@@ -47,8 +92,10 @@ def main() -> None:
 
     st.markdown(
         """
+        <link rel="preconnect" href="https://fonts.googleapis.com">
+        <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+        <link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@400;600;700&family=DM+Mono:wght@400;500&display=swap">
         <style>
-        @import url('https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@400;600;700&family=DM+Mono:wght@400;500&display=swap');
         :root {
             --bg: #0b0f12;
             --panel: #121820;
@@ -160,95 +207,81 @@ def main() -> None:
 
     left, right = st.columns([1.2, 1])
     with left:
-        st.markdown("<div class='card'>", unsafe_allow_html=True)
-        st.markdown(f"<div class='badge'>{sentiment}</div>", unsafe_allow_html=True)
-        st.markdown(f"<h3>{callout}</h3>", unsafe_allow_html=True)
         generated_local = now.astimezone(riyadh_tz)
-        st.markdown(
-            "<div class='metric-block'>"
-            "<div class='metric-label'>Generated (KSA)</div>"
-            f"<div class='metric-value'>{generated_local.strftime('%Y-%m-%d %I:%M %p')}</div>"
-            "</div>",
-            unsafe_allow_html=True,
-        )
-        st.markdown(
-            "<div class='metric-block'>"
-            f"<div class='metric-label'>News window</div>"
-            f"<div class='metric-value'>{window_label}</div>"
-            "</div>",
-            unsafe_allow_html=True,
-        )
-        st.markdown(
-            "<div class='metric-block'>"
-            f"<div class='metric-label'>Combined signal</div>"
-            f"<div class='metric-value'>{combined_score:+.3f}</div>"
-            "</div>",
-            unsafe_allow_html=True,
+        left_html = "".join(
+            [
+                "<div class='card'>",
+                f"<div class='badge'>{sentiment}</div>",
+                f"<h3>{callout}</h3>",
+                "<div class='metric-block'>"
+                "<div class='metric-label'>Generated (KSA)</div>"
+                f"<div class='metric-value'>{generated_local.strftime('%Y-%m-%d %I:%M %p')}</div>"
+                "</div>",
+                "<div class='metric-block'>"
+                "<div class='metric-label'>News window</div>"
+                f"<div class='metric-value'>{window_label}</div>"
+                "</div>",
+                "<div class='metric-block'>"
+                "<div class='metric-label'>Combined signal</div>"
+                f"<div class='metric-value'>{combined_score:+.3f}</div>"
+                "</div>",
+                "</div>",
+            ]
         )
-        st.markdown("</div>", unsafe_allow_html=True)
+        st.markdown(left_html, unsafe_allow_html=True)
 
     with right:
-        st.markdown("<div class='card'>", unsafe_allow_html=True)
-        st.markdown(
-            "<div class='metric-block'>"
-            "<div class='metric-label'>BTC-USD last close (KSA)</div>"
-            f"<div class='metric-value'>{futures.last_price:,.2f}</div>"
-            f"<div class='metric-label'>"
-            f"{futures.last_close_time.astimezone(riyadh_tz).strftime('%Y-%m-%d %I:%M %p')}"
-            f"</div>"
-            "</div>",
-            unsafe_allow_html=True,
-        )
-        st.markdown(
-            "<div class='metric-block'>"
-            "<div class='metric-label'>Previous close (KSA)</div>"
-            f"<div class='metric-value'>{futures.yesterday_close:,.2f}</div>"
-            f"<div class='metric-label'>"
-            f"{futures.yesterday_close_time.astimezone(riyadh_tz).strftime('%Y-%m-%d %I:%M %p')}"
-            f"</div>"
-            "</div>",
-            unsafe_allow_html=True,
-        )
         delta_color = "var(--accent-2)" if futures.pct_change_since_close >= 0 else "var(--danger)"
-        st.markdown(
-            "<div class='metric-block'>"
-            "<div class='metric-label'>"
-            "Change between those closes</div>"
-            f"<div class='metric-value' style='color:{delta_color};'>"
-            f"{futures.pct_change_since_close:+.2f}%</div>"
-            "</div>",
-            unsafe_allow_html=True,
-        )
-        st.markdown(
-            "<div class='metric-block'>"
-            "<div class='metric-label'>Expected move vs previous close</div>"
-            f"<div class='metric-value'>{move_pct:+.2f}%</div>"
-            "</div>",
-            unsafe_allow_html=True,
+        right_html = "".join(
+            [
+                "<div class='card'>",
+                "<div class='metric-block'>"
+                "<div class='metric-label'>BTC-USD last close (KSA)</div>"
+                f"<div class='metric-value'>{futures.last_price:,.2f}</div>"
+                "<div class='metric-label'>"
+                f"{futures.last_close_time.astimezone(riyadh_tz).strftime('%Y-%m-%d %I:%M %p')}"
+                "</div>"
+                "</div>",
+                "<div class='metric-block'>"
+                "<div class='metric-label'>Previous close (KSA)</div>"
+                f"<div class='metric-value'>{futures.yesterday_close:,.2f}</div>"
+                "<div class='metric-label'>"
+                f"{futures.yesterday_close_time.astimezone(riyadh_tz).strftime('%Y-%m-%d %I:%M %p')}"
+                "</div>"
+                "</div>",
+                "<div class='metric-block'>"
+                "<div class='metric-label'>"
+                "Change between those closes</div>"
+                f"<div class='metric-value' style='color:{delta_color};'>"
+                f"{futures.pct_change_since_close:+.2f}%</div>"
+                "</div>",
+                "<div class='metric-block'>"
+                "<div class='metric-label'>Expected move vs previous close</div>"
+                f"<div class='metric-value'>{move_pct:+.2f}%</div>"
+                "</div>",
+                "</div>",
+            ]
         )
-        st.markdown("</div>", unsafe_allow_html=True)
+        st.markdown(right_html, unsafe_allow_html=True)
 
     st.markdown("")
-    st.markdown("<div class='card'>", unsafe_allow_html=True)
-    st.markdown("<h3>Recent BTC headlines (KSA)</h3>", unsafe_allow_html=True)
+    headline_parts = ["<div class='card'>", "<h3>Recent BTC headlines (KSA)</h3>"]
     if not filtered:
-        st.markdown("<div class='subtitle'>No recent headlines found.</div>", unsafe_allow_html=True)
-    else:
-        for item in filtered[:10]:
-            st.markdown(
-                "<div class='headline'>"
-                f"<time>{item.published.astimezone(riyadh_tz).strftime('%Y-%m-%d %I:%M %p')}</time>"
-                f"{item.title}"
-                f"<span class='score'>{item.score:+.2f}</span>"
-                "</div>",
-                unsafe_allow_html=True,
+        headline_parts.append("<div class='subtitle'>No recent headlines found.</div>")
+    for item in filtered[:10]:
+        headline_parts.append(
+            "<div class='headline'>"
+            f"<time>{item.published.astimezone(riyadh_tz).strftime('%Y-%m-%d %I:%M %p')}</time>"
+            f"{item.title}"
+            f"<span class='score'>{item.score:+.2f}</span>"
+            "</div>"
+        )
+        if item.link:
+            headline_parts.append(
+                f"<a href='{item.link}' target='_blank'>{item.link}</a>"
             )
-            if item.link:
-                st.markdown(
-                    f"<a href='{item.link}' target='_blank'>{item.link}</a>",
-                    unsafe_allow_html=True,
-                )
-    st.markdown("</div>", unsafe_allow_html=True)
+    headline_parts.append("</div>")
+    st.markdown("".join(headline_parts), unsafe_allow_html=True)
 
 
 if __name__ == "__main__":
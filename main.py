@@ -2,15 +2,23 @@
 from __future__ import annotations
 
 import calendar
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
+from pathlib import Path
+import pickle
 import re
 import sys
+import threading
 import time
-from typing import Iterable, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple
 
-import feedparser
-import requests
+import numpy as np
+
+if TYPE_CHECKING:
+    import requests
 
 
 RSS_SOURCES = [
@@ -21,8 +29,14 @@ RSS_SOURCES = [
 
 USER_AGENT = "bitcoin-news-sentiment/0.1"
 YAHOO_SYMBOL = "BTC-USD"
-
-POSITIVE_WORDS = {
+FEED_CACHE_PATH = Path.home() / ".cache" / "btcpred" / "feeds.pkl"
+FEED_TIMEOUT = 10
+FEED_FAILURE_THRESHOLD = 2
+FEED_MAX_COOLDOWN = 3600
+MAX_CONCURRENT_FEEDS = 4
+FEED_STAGGER_SECONDS = 0.1
+
+POSITIVE_WORDS = frozenset({
     "beat",
     "breakout",
     "bull",
@@ -45,9 +59,9 @@ POSITIVE_WORDS = {
     "strong",
     "surge",
     "up",
-}
+})
 
-NEGATIVE_WORDS = {
+NEGATIVE_WORDS = frozenset({
     "bear",
     "bearish",
     "crash",
@@ -67,7 +81,19 @@ NEGATIVE_WORDS = {
     "slump",
     "weak",
     "worse",
-}
+})
+
+_WS_RE = re.compile(r"\s+")
+
+# Entry fields fetch_news reads; only these are cached and persisted.
+_ENTRY_FIELDS = ("title", "link", "summary", "published_parsed", "updated_parsed")
+
+# url -> (etag, last-modified, entries) from the last successful download.
+_FEED_CACHE: Dict[str, Tuple[Optional[str], Optional[str], List[dict]]] = {}
+# url -> (consecutive failures, unix time until which the feed is skipped).
+_FEED_HEALTH: Dict[str, Tuple[int, float]] = {}
+# Process-wide cap on in-flight feed downloads, shared by concurrent callers.
+_FEED_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_FEEDS)
 
 
 @dataclass(frozen=True)
@@ -79,6 +105,39 @@ class NewsItem:
     score: float
 
 
+@dataclass(frozen=True, eq=False)
+class NewsTable:
+    titles: List[str]
+    links: List[str]
+    summaries: List[str]
+    published: np.ndarray  # int64 unix seconds (UTC)
+    scores: np.ndarray  # float64
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def __getitem__(self, index: slice | np.ndarray) -> NewsTable:
+        positions = np.arange(len(self))[index]
+        return NewsTable(
+            titles=[self.titles[i] for i in positions],
+            links=[self.links[i] for i in positions],
+            summaries=[self.summaries[i] for i in positions],
+            published=self.published[positions],
+            scores=self.scores[positions],
+        )
+
+    def __iter__(self) -> Iterator[NewsItem]:
+        rows = zip(self.titles, self.links, self.summaries, self.published, self.scores)
+        for title, link, summary, published, score in rows:
+            yield NewsItem(
+                title=title,
+                link=link,
+                published=datetime.fromtimestamp(int(published), tz=timezone.utc),
+                summary=summary,
+                score=float(score),
+            )
+
+
 @dataclass(frozen=True)
 class FuturesSnapshot:
     last_price: float
@@ -89,104 +148,220 @@ class FuturesSnapshot:
     avg_abs_daily_return: float
 
 
-def _to_datetime(parsed: Optional[Tuple]) -> Optional[datetime]:
+def _lexicon_pattern(words: Iterable[str]) -> re.Pattern[str]:
+    alternation = "|".join(re.escape(word) for word in sorted(words))
+    return re.compile(rf"(?<![a-zA-Z'])(?:{alternation})(?![a-zA-Z'])")
+
+
+_POSITIVE_RE = _lexicon_pattern(POSITIVE_WORDS)
+_NEGATIVE_RE = _lexicon_pattern(NEGATIVE_WORDS)
+
+
+def _to_timestamp(parsed: Optional[Tuple]) -> Optional[int]:
     if not parsed:
         return None
-    return datetime.fromtimestamp(calendar.timegm(parsed), tz=timezone.utc)
+    return calendar.timegm(parsed)
 
 
 def _clean_text(text: str) -> str:
-    return re.sub(r"\s+", " ", text or "").strip()
+    return _WS_RE.sub(" ", text or "").strip()
 
 
+@lru_cache(maxsize=4096)
 def _score_text(text: str) -> float:
-    tokens = re.findall(r"[a-zA-Z']+", text.lower())
-    if not tokens:
-        return 0.0
-    positives = sum(1 for t in tokens if t in POSITIVE_WORDS)
-    negatives = sum(1 for t in tokens if t in NEGATIVE_WORDS)
+    text = text.lower()
+    positives = len(_POSITIVE_RE.findall(text))
+    negatives = len(_NEGATIVE_RE.findall(text))
     if positives == 0 and negatives == 0:
         return 0.0
     return (positives - negatives) / max(1, positives + negatives)
 
 
-def fetch_news(sources: Iterable[str]) -> List[NewsItem]:
+def create_session(retries: int, pool_size: int = 10) -> requests.Session:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=max(0, retries - 1),
+        backoff_factor=1.5,
+        status_forcelist=[429, 502, 503, 504],
+        respect_retry_after_header=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
+@lru_cache(maxsize=None)
+def _get_session(retries: int) -> requests.Session:
+    return create_session(retries)
+
+
+def _load_feed_cache() -> None:
+    try:
+        with FEED_CACHE_PATH.open("rb") as handle:
+            cached = pickle.load(handle)
+        _FEED_CACHE.update(
+            (url, (etag, modified, entries))
+            for url, (etag, modified, entries) in cached.items()
+            if isinstance(entries, list)
+        )
+    except Exception:
+        pass
+
+
+def _save_feed_cache() -> None:
+    tmp_path = FEED_CACHE_PATH.with_suffix(".tmp")
+    try:
+        FEED_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("wb") as handle:
+            pickle.dump(_FEED_CACHE, handle)
+        tmp_path.replace(FEED_CACHE_PATH)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _fetch_feed(url: str, headers: dict) -> Tuple[List[dict], bool]:
+    import feedparser
+    import requests
+
+    etag, modified, cached = _FEED_CACHE.get(url, (None, None, None))
+    request_headers = dict(headers)
+    if etag:
+        request_headers["If-None-Match"] = etag
+    if modified:
+        request_headers["If-Modified-Since"] = modified
+    try:
+        with _FEED_SLOTS:
+            response = _get_session(1).get(
+                url, headers=request_headers, timeout=FEED_TIMEOUT
+            )
+            time.sleep(FEED_STAGGER_SECONDS)
+        response.raise_for_status()
+    except requests.RequestException:
+        fail_count = _FEED_HEALTH.get(url, (0, 0.0))[0] + 1
+        cooldown_until = 0.0
+        if fail_count >= FEED_FAILURE_THRESHOLD:
+            cooldown_until = time.time() + min(FEED_MAX_COOLDOWN, 30 * 2**fail_count)
+        _FEED_HEALTH[url] = (fail_count, cooldown_until)
+        return [], False
+    _FEED_HEALTH.pop(url, None)
+
+    if response.status_code == 304 and cached is not None:
+        return cached, False
+    response_headers = {key.lower(): value for key, value in response.headers.items()}
+    response_headers.setdefault("content-location", response.url)
+    feed = feedparser.parse(response.content, response_headers=response_headers)
+    entries = [
+        {field: entry[field] for field in _ENTRY_FIELDS if field in entry}
+        for entry in feed.entries
+    ]
+    if not entries:
+        return [], False
+    _FEED_CACHE[url] = (
+        response.headers.get("ETag"),
+        response.headers.get("Last-Modified"),
+        entries,
+    )
+    return entries, True
+
+
+def fetch_news(
+    sources: Iterable[str], executor: Optional[Executor] = None
+) -> NewsTable:
     headers = {"User-Agent": USER_AGENT}
-    items: List[NewsItem] = []
+    now_ts = time.time()
+    urls = [
+        url for url in sources if _FEED_HEALTH.get(url, (0, 0.0))[1] <= now_ts
+    ]
+    titles: List[str] = []
+    links: List[str] = []
+    summaries: List[str] = []
+    published_ts: List[int] = []
+    scores: List[float] = []
     seen = set()
 
-    for url in sources:
-        feed = feedparser.parse(url, request_headers=headers)
-        for entry in feed.entries:
-            published = _to_datetime(
-                entry.get("published_parsed") or entry.get("updated_parsed")
-            )
-            if not published:
-                continue
+    if not _FEED_CACHE:
+        _load_feed_cache()
+    if executor is None:
+        workers = max(1, min(len(urls), MAX_CONCURRENT_FEEDS))
+        pool = ThreadPoolExecutor(max_workers=workers)
+    else:
+        pool = nullcontext(executor)
+    with pool as feed_executor:
+        jobs = [feed_executor.submit(_fetch_feed, url, headers) for url in urls]
+        results = [job.result() for job in jobs]
+    feeds = [entries for entries, _ in results]
+    if any(stored for _, stored in results):
+        _save_feed_cache()
+
+    for entries in feeds:
+        for entry in entries:
             title = _clean_text(entry.get("title", ""))
             link = entry.get("link", "")
-            summary = _clean_text(entry.get("summary", ""))
             dedupe_key = (title.lower(), link)
             if not title or dedupe_key in seen:
                 continue
-            seen.add(dedupe_key)
-            score = _score_text(f"{title} {summary}")
-            items.append(
-                NewsItem(
-                    title=title,
-                    link=link,
-                    published=published,
-                    summary=summary,
-                    score=score,
-                )
+            published = _to_timestamp(
+                entry.get("published_parsed") or entry.get("updated_parsed")
             )
-
-    items.sort(key=lambda item: item.published, reverse=True)
-    return items
+            if published is None:
+                continue
+            seen.add(dedupe_key)
+            summary = _clean_text(entry.get("summary", ""))
+            titles.append(title)
+            links.append(link)
+            summaries.append(summary)
+            published_ts.append(published)
+            scores.append(_score_text(f"{title} {summary}"))
+
+    table = NewsTable(
+        titles=titles,
+        links=links,
+        summaries=summaries,
+        published=np.array(published_ts, dtype=np.int64),
+        scores=np.array(scores, dtype=np.float64),
+    )
+    return table[np.argsort(-table.published, kind="stable")]
 
 
 def filter_recent(
-    items: Iterable[NewsItem],
+    news: NewsTable,
     now: datetime,
     today_only: bool,
-) -> Tuple[List[NewsItem], str]:
-    today_items = [item for item in items if item.published.date() == now.date()]
-    if today_items:
-        return today_items, "today"
+) -> Tuple[NewsTable, str]:
+    day_start = datetime(now.year, now.month, now.day, tzinfo=timezone.utc).timestamp()
+    today = (news.published >= day_start) & (news.published < day_start + 86400)
+    if today.any():
+        return news[today], "today"
     if today_only:
-        return [], "none"
-    cutoff = now - timedelta(hours=24)
-    recent_items = [item for item in items if item.published >= cutoff]
-    return recent_items, "last_24h"
+        return news[:0], "none"
+    cutoff = (now - timedelta(hours=24)).timestamp()
+    return news[news.published >= cutoff], "last_24h"
 
 
-def fetch_price_snapshot(
-    symbol: str, timeout: int, retries: int
-) -> FuturesSnapshot:
-    chart_url = (
-        "https://query1.finance.yahoo.com/v8/finance/chart/"
-        f"{symbol}?range=7d&interval=1d&includePrePost=false"
-    )
+def _fetch_json(
+    url: str,
+    timeout: int,
+    session: requests.Session,
+    params: Optional[dict] = None,
+) -> dict | list:
+    import requests
+
     headers = {"User-Agent": USER_AGENT}
+    try:
+        response = session.get(url, params=params, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+    except requests.RequestException as exc:
+        raise RuntimeError(f"Failed to fetch {url}") from exc
 
-    def fetch_json(url: str) -> dict | list:
-        last_exc: Optional[Exception] = None
-        for attempt in range(1, retries + 1):
-            try:
-                response = requests.get(url, headers=headers, timeout=timeout)
-                response.raise_for_status()
-                return response.json()
-            except requests.RequestException as exc:
-                last_exc = exc
-                if attempt < retries:
-                    time.sleep(1.5 * attempt)
-        raise RuntimeError(f"Failed to fetch {url}") from last_exc
-
-    chart = fetch_json(chart_url)
-    result = chart.get("chart", {}).get("result", [])
-    if not result:
-        raise RuntimeError("No chart data returned from Yahoo Finance.")
-    series = result[0]
+
+def _snapshot_from_series(series: dict) -> FuturesSnapshot:
     timestamps = series.get("timestamp", [])
     indicators = series.get("indicators", {}).get("quote", [])
     if not timestamps or not indicators:
@@ -195,27 +370,26 @@ def fetch_price_snapshot(
     if not closes or len(closes) < 2:
         raise RuntimeError("Not enough close data from Yahoo Finance.")
 
-    cleaned: List[Tuple[int, float]] = []
-    for ts, close in zip(timestamps, closes):
-        if close is None:
-            continue
-        cleaned.append((ts, float(close)))
-    if len(cleaned) < 2:
+    count = min(len(timestamps), len(closes))
+    prices = np.array(closes[:count], dtype=float)
+    valid = ~np.isnan(prices)
+    times = np.array(timestamps[:count], dtype=np.int64)[valid]
+    prices = prices[valid]
+    if prices.size < 2:
         raise RuntimeError("Not enough valid close data from Yahoo Finance.")
 
-    cleaned.sort(key=lambda item: item[0])
-    last_close_ts, last_close = cleaned[-1]
-    yesterday_close_ts, yesterday_close = cleaned[-2]
-    last_close_time = datetime.fromtimestamp(last_close_ts, tz=timezone.utc)
-    yesterday_close_time = datetime.fromtimestamp(yesterday_close_ts, tz=timezone.utc)
+    order = np.argsort(times, kind="stable")
+    times = times[order]
+    prices = prices[order]
+    last_close = float(prices[-1])
+    yesterday_close = float(prices[-2])
+    last_close_time = datetime.fromtimestamp(int(times[-1]), tz=timezone.utc)
+    yesterday_close_time = datetime.fromtimestamp(int(times[-2]), tz=timezone.utc)
     pct_change_since_close = (last_close - yesterday_close) / yesterday_close * 100.0
-    returns: List[float] = []
-    for i in range(1, len(cleaned)):
-        prev_close = cleaned[i - 1][1]
-        close = cleaned[i][1]
-        if prev_close > 0:
-            returns.append(abs((close - prev_close) / prev_close))
-    avg_abs_daily_return = sum(returns) / len(returns) if returns else 0.0
+    prev_closes = prices[:-1]
+    positive = prev_closes > 0
+    returns = np.abs(np.diff(prices)[positive] / prev_closes[positive])
+    avg_abs_daily_return = float(returns.mean()) if returns.size else 0.0
 
     return FuturesSnapshot(
         last_price=last_close,
@@ -227,24 +401,69 @@ def fetch_price_snapshot(
     )
 
 
-def combine_signal(news_items: List[NewsItem], futures: FuturesSnapshot) -> float:
-    if news_items:
-        news_score = sum(item.score for item in news_items) / len(news_items)
-    else:
-        news_score = 0.0
+def fetch_price_snapshot(
+    symbol: str,
+    timeout: int,
+    retries: int,
+    session: Optional[requests.Session] = None,
+) -> FuturesSnapshot:
+    chart_url = (
+        "https://query1.finance.yahoo.com/v8/finance/chart/"
+        f"{symbol}?range=7d&interval=1d&includePrePost=false"
+    )
+    chart = _fetch_json(chart_url, timeout, session or _get_session(retries))
+    result = chart.get("chart", {}).get("result", [])
+    if not result:
+        raise RuntimeError("No chart data returned from Yahoo Finance.")
+    return _snapshot_from_series(result[0])
+
+
+def fetch_price_snapshots(
+    symbols: Iterable[str],
+    timeout: int,
+    retries: int,
+    session: Optional[requests.Session] = None,
+) -> Dict[str, FuturesSnapshot]:
+    symbols = list(symbols)
+    spark = _fetch_json(
+        "https://query1.finance.yahoo.com/v7/finance/spark",
+        timeout,
+        session or _get_session(retries),
+        params={"symbols": ",".join(symbols), "range": "7d", "interval": "1d"},
+    )
+    snapshots: Dict[str, FuturesSnapshot] = {}
+    for result in spark.get("spark", {}).get("result") or []:
+        series = result.get("response") or []
+        if result.get("symbol") in symbols and series:
+            snapshots[result["symbol"]] = _snapshot_from_series(series[0])
+    missing = [symbol for symbol in symbols if symbol not in snapshots]
+    if missing:
+        raise RuntimeError(
+            f"No chart data returned from Yahoo Finance for {', '.join(missing)}."
+        )
+    return snapshots
 
+
+@lru_cache(maxsize=256)
+def _combine_scores(news_score: float, futures: FuturesSnapshot) -> float:
     price_score = max(-1.0, min(1.0, futures.pct_change_since_close / 5.0))
     combined = (0.7 * news_score) + (0.3 * price_score)
     return combined
 
 
+def combine_signal(news_items: NewsTable, futures: FuturesSnapshot) -> float:
+    news_score = float(news_items.scores.mean()) if len(news_items) else 0.0
+    return _combine_scores(news_score, futures)
+
+
+@lru_cache(maxsize=256)
 def expected_move_pct(combined_score: float, futures: FuturesSnapshot) -> float:
     scaled = max(-1.0, min(1.0, combined_score))
     return scaled * futures.avg_abs_daily_return * 100.0
 
 
 def format_report(
-    news_items: List[NewsItem],
+    news_items: NewsTable,
     source_label: str,
     futures: FuturesSnapshot,
     combined_score: float,
@@ -312,12 +531,16 @@ def main() -> int:
     timeout = 25
     retries = 3
 
-    news = fetch_news(RSS_SOURCES)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        price_job = executor.submit(
+            fetch_price_snapshot, YAHOO_SYMBOL, timeout, retries
+        )
+        news = fetch_news(RSS_SOURCES)
     filtered, window_label = filter_recent(news, now, today_only=True)
     filtered = filtered[:max_articles]
 
     try:
-        futures = fetch_price_snapshot(YAHOO_SYMBOL, timeout, retries)
+        futures = price_job.result()
     except Exception as exc:
         print(
             "Failed to fetch Yahoo Finance data. "